@@ -0,0 +1 @@
+# 空文件 
\ No newline at end of file
@@ -0,0 +1,271 @@
+"""性能基准测试
+
+在仓库根目录运行:
+    python -m benchmarks.run --strikes 10,50,200 --positions 1,10,100
+    python -m benchmarks.run --compare old.json new.json
+"""
+import io
+import os
+import sys
+import json
+import time
+import logging
+import warnings
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+from contextlib import redirect_stdout
+from datetime import datetime
+from typing import Callable, Dict, List
+
+# 图表测试使用无界面的Qt平台
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+
+from benchmarks.stub_server import StubOkxServer, SyntheticChain
+from src.api.okx_api import OkxApi
+from src.utils.payoff_calculator import calculate_payoff
+from src.utils.greeks_calculator import calculate_greeks, calculate_time_to_expiry
+from src.utils.black76_calculator import black76_inverse, calculate_inverse_greeks
+from src.utils.forward_curve import ForwardCurve
+from src.utils.position_manager import PositionManager
+
+GROUPS = ["api", "pricing", "payoff", "positions", "ui"]
+
+
+def measure(name: str, func: Callable, repeat: int, **params) -> Dict:
+    """重复运行函数并统计耗时（毫秒）"""
+    func()  # 预热
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    result = {
+        "name": name,
+        "params": params,
+        "repeat": repeat,
+        "min_ms": min(samples),
+        "median_ms": statistics.median(samples),
+        "mean_ms": statistics.mean(samples),
+        "max_ms": max(samples)
+    }
+    report(result)
+    return result
+
+
+def report(result: Dict):
+    """打印单项测试结果"""
+    print(f"{result['name']:<36} {json.dumps(result['params']):<40} median={result['median_ms']:10.3f}ms")
+
+
+def bench_api(chain: SyntheticChain, repeat: int) -> List[Dict]:
+    """合约列表、到期日和行权价加载"""
+    api = OkxApi()
+    expiry = chain.expiries[0].strftime("%y%m%d")
+    params = {"instruments": len(chain.instruments)}
+    return [
+        measure("api.get_instruments", api.get_instruments, repeat, **params),
+        measure("api.get_expiry_dates", api.get_expiry_dates, repeat, **params),
+        measure("api.get_strike_prices", lambda: api.get_strike_prices(expiry=expiry), repeat, **params)
+    ]
+
+
+def bench_pricing(chain: SyntheticChain, repeat: int) -> List[Dict]:
+    """整条期权链的批量定价和远期曲线"""
+    results = []
+
+    expiries = [inst["instId"].split("-")[2] for inst in chain.instruments]
+    forwards = np.array([chain.forwards[e] for e in expiries])
+    strikes = np.array([float(inst["stk"]) for inst in chain.instruments])
+    times = np.array([calculate_time_to_expiry(e) for e in expiries])
+    is_call = np.array([inst["optType"] == "C" for inst in chain.instruments])
+    results.append(measure(
+        "pricing.black76_inverse_chain",
+        lambda: black76_inverse(forwards, strikes, times, 0.6, is_call),
+        repeat, instruments=len(chain.instruments)
+    ))
+
+    curve = ForwardCurve()
+    results.append(measure("pricing.forward_curve_refresh", curve.refresh, repeat,
+                           expiries=chain.n_expiries, instruments=len(chain.instruments)))
+    return results
+
+
+def bench_payoff(positions: List[Dict], repeat: int) -> List[Dict]:
+    """到期盈亏和组合希腊字母"""
+    spot_prices = np.linspace(30000, 90000, 200)
+    curve = ForwardCurve(ttl=3600)  # 远期曲线已缓存
+    return [
+        measure("payoff.calculate_payoff", lambda: calculate_payoff(positions, spot_prices), repeat,
+                positions=len(positions), points=len(spot_prices)),
+        measure("greeks.calculate_greeks", lambda: calculate_greeks(positions), repeat,
+                positions=len(positions)),
+        measure("greeks.calculate_inverse_greeks", lambda: calculate_inverse_greeks(positions, curve), repeat,
+                positions=len(positions))
+    ]
+
+
+def bench_positions(positions: List[Dict], repeat: int) -> List[Dict]:
+    """组合文件的保存和加载（加载时逐个请求期权价格）"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "positions.json")
+        results = [measure("positions.save", lambda: PositionManager.save_positions(positions, filename),
+                           repeat, positions=len(positions))]
+        # 加载时每个头寸都会打印调试信息，屏蔽输出以免终端I/O计入耗时
+        with redirect_stdout(io.StringIO()):
+            result = measure("positions.load", lambda: PositionManager.load_positions(filename),
+                             repeat, positions=len(positions))
+        report(result)
+        results.append(result)
+    return results
+
+
+def bench_ui(window, positions: List[Dict], repeat: int) -> List[Dict]:
+    """头寸表格刷新、盈亏平衡点搜索和图表重绘"""
+    window.positions = [dict(pos) for pos in positions]
+    strikes = [float(pos["strike"]) for pos in positions]
+    spot_prices = np.linspace(min(strikes) * 0.8, max(strikes) * 1.2, 200)
+    return [
+        measure("ui.update_position_table", window.update_position_table, repeat, positions=len(positions)),
+        measure("ui.find_breakeven_points", lambda: window.find_breakeven_points(strikes, spot_prices),
+                repeat, positions=len(positions)),
+        measure("ui.update_chart", window.update_chart, repeat, positions=len(positions))
+    ]
+
+
+def create_window():
+    """创建离屏主窗口，缺少Qt时返回None"""
+    try:
+        from PyQt6.QtWidgets import QApplication
+        from src.ui.main_window import MainWindow
+    except ImportError as e:
+        print(f"跳过界面测试: {e}")
+        return None, None
+
+    # 缺少中文字体时matplotlib会大量告警
+    logging.getLogger("matplotlib.font_manager").setLevel(logging.ERROR)
+    warnings.filterwarnings("ignore", message="Glyph .* missing from font")
+    app = QApplication.instance() or QApplication(sys.argv)
+    return app, MainWindow()
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except Exception:
+        return "unknown"
+
+
+def run(args) -> Dict:
+    groups = args.groups.split(",")
+    strike_counts = [int(n) for n in args.strikes.split(",")]
+    position_counts = [int(n) for n in args.positions.split(",")]
+    results = []
+
+    with StubOkxServer() as server:
+        os.environ["OKX_BASE_URL"] = server.base_url
+
+        for n_strikes in strike_counts:
+            chain = SyntheticChain(n_expiries=args.expiries, n_strikes=n_strikes, seed=args.seed)
+            server.set_chain(chain)
+
+            if "api" in groups:
+                results += bench_api(chain, args.repeat)
+            if "pricing" in groups:
+                results += bench_pricing(chain, args.repeat)
+
+        # 以下测试只与头寸数量有关，使用默认规模的期权链
+        chain = SyntheticChain(n_expiries=args.expiries, seed=args.seed)
+        server.set_chain(chain)
+        window = None
+        if "ui" in groups:
+            app, window = create_window()
+
+        for count in position_counts:
+            positions = chain.sample_positions(count)
+            if "payoff" in groups:
+                results += bench_payoff(positions, args.repeat)
+            if "positions" in groups:
+                results += bench_positions(positions, args.repeat)
+            if window is not None:
+                results += bench_ui(window, positions, args.repeat)
+
+    return {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "args": vars(args)
+        },
+        "results": results
+    }
+
+
+def compare(base_file: str, new_file: str, threshold: float) -> int:
+    """比较两次结果的中位数耗时，返回变慢超过阈值的条目数"""
+    def load(filename):
+        with open(filename, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        results = {}
+        for r in data["results"]:
+            key = (r["name"], json.dumps(r["params"], sort_keys=True))
+            if key in results:
+                raise ValueError(f"{filename} 中存在重复的测试条目: {key[0]} {key[1]}")
+            results[key] = r
+        return data["meta"], results
+
+    base_meta, base = load(base_file)
+    new_meta, new = load(new_file)
+    print(f"{base_meta['commit']} -> {new_meta['commit']}")
+
+    regressions = 0
+    for key in sorted(base.keys() & new.keys()):
+        ratio = new[key]["median_ms"] / base[key]["median_ms"] if base[key]["median_ms"] else float("inf")
+        flag = ""
+        if ratio > threshold:
+            flag = "  <-- 变慢"
+            regressions += 1
+        print(f"{key[0]:<36} {key[1]:<40} {base[key]['median_ms']:10.3f} -> "
+              f"{new[key]['median_ms']:10.3f}ms  x{ratio:.2f}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="期权工具性能基准测试")
+    parser.add_argument("--strikes", default="10,50,200", help="每个到期日每种类型的行权价数量，逗号分隔")
+    parser.add_argument("--expiries", type=int, default=8, help="到期日数量")
+    parser.add_argument("--positions", default="1,10,100", help="头寸数量，逗号分隔")
+    parser.add_argument("--repeat", type=int, default=5, help="每项重复次数")
+    parser.add_argument("--seed", type=int, default=0, help="随机种子")
+    parser.add_argument("--groups", default=",".join(GROUPS), help=f"测试分组: {','.join(GROUPS)}")
+    parser.add_argument("--output", help="结果文件，默认 benchmarks/results/<commit>.json")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"), help="比较两个结果文件")
+    parser.add_argument("--threshold", type=float, default=1.2, help="判定变慢的耗时比例")
+    args = parser.parse_args()
+
+    unknown = sorted(set(args.groups.split(",")) - set(GROUPS))
+    if unknown:
+        parser.error(f"未知的测试分组: {','.join(unknown)}，可选: {','.join(GROUPS)}")
+
+    if args.compare:
+        sys.exit(1 if compare(*args.compare, args.threshold) else 0)
+
+    data = run(args)
+    output = args.output or os.path.join("benchmarks", "results", f"{data['meta']['commit']}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=4, ensure_ascii=False)
+    print(f"结果已保存到 {output}")
+
+
+if __name__ == "__main__":
+    main()
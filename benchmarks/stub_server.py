@@ -0,0 +1,156 @@
+import json
+import random
+import threading
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import urlparse, parse_qs
+
+from src.utils.black76_calculator import black76_inverse
+
+
+class SyntheticChain:
+    """可配置规模的合成期权链（币本位，价格由Black-76生成）"""
+
+    def __init__(self, underlying: str = "BTC-USD", spot: float = 60000.0,
+                 n_expiries: int = 8, n_strikes: int = 50, strike_step: float = 1000.0,
+                 volatility: float = 0.6, carry: float = 0.05, seed: int = 0):
+        self.underlying = underlying
+        self.spot = spot
+        self.n_expiries = n_expiries
+        self.n_strikes = n_strikes
+        self.rng = random.Random(seed)
+
+        today = datetime.now().replace(hour=16, minute=0, second=0, microsecond=0)
+        self.expiries = [today + timedelta(days=7 * (i + 1)) for i in range(n_expiries)]
+
+        # 行权价以现货为中心，且不低于一个步长
+        first = max(strike_step, round(spot / strike_step) * strike_step - strike_step * (n_strikes // 2))
+        self.strikes = [first + strike_step * i for i in range(n_strikes)]
+
+        self.forwards: Dict[str, float] = {}
+        self.option_tickers: Dict[str, Dict] = {}
+        self.instruments: List[Dict] = []
+        for expiry in self.expiries:
+            expiry_str = expiry.strftime("%y%m%d")
+            t = (expiry - datetime.now()).total_seconds() / (365 * 86400)
+            forward = spot * (1 + carry * t)
+            self.forwards[expiry_str] = forward
+
+            for option_type in ("C", "P"):
+                prices = black76_inverse(forward, self.strikes, t, volatility, option_type == "C")["price_coin"]
+                for strike, price in zip(self.strikes, prices):
+                    inst_id = f"{underlying}-{expiry_str}-{int(strike):05d}-{option_type}"
+                    self.instruments.append({
+                        "instId": inst_id,
+                        "instType": "OPTION",
+                        "uly": underlying,
+                        "optType": option_type,
+                        "stk": str(strike),
+                        "expTime": str(int(expiry.timestamp() * 1000))
+                    })
+                    self.option_tickers[inst_id] = {
+                        "instId": inst_id,
+                        "bidPx": f"{max(price * 0.98, 0.0001):.4f}",
+                        "askPx": f"{max(price * 1.02, 0.0001):.4f}",
+                        "last": f"{max(price, 0.0001):.4f}"
+                    }
+
+    def futures_tickers(self) -> List[Dict]:
+        """交割合约行情"""
+        return [{
+            "instId": f"{self.underlying}-{expiry}",
+            "bidPx": f"{forward - 5:.1f}",
+            "askPx": f"{forward + 5:.1f}",
+            "last": f"{forward:.1f}"
+        } for expiry, forward in self.forwards.items()]
+
+    def sample_positions(self, count: int) -> List[Dict]:
+        """从期权链中随机抽取头寸"""
+        positions = []
+        for _ in range(count):
+            expiry = self.rng.choice(self.expiries).strftime("%y%m%d")
+            strike = self.rng.choice(self.strikes)
+            option_type = self.rng.choice(["C", "P"])
+            side = self.rng.choice(["buy", "sell"])
+            ticker = self.option_tickers[f"{self.underlying}-{expiry}-{int(strike):05d}-{option_type}"]
+            positions.append({
+                "underlying": self.underlying,
+                "expiry": expiry,
+                "strike": strike,
+                "type": option_type,
+                "side": side,
+                "quantity": self.rng.randint(1, 10),
+                "price": float(ticker["askPx"] if side == "buy" else ticker["bidPx"])
+            })
+        return positions
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """模拟OKX公共行情接口"""
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, data: List[Dict], code: str = "0", msg: str = ""):
+        body = json.dumps({"code": code, "msg": msg, "data": data}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        chain = self.server.chain
+        url = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+
+        if url.path == "/api/v5/public/instruments":
+            self._send(chain.instruments)
+        elif url.path == "/api/v5/market/ticker":
+            ticker = chain.option_tickers.get(params.get("instId"))
+            if ticker:
+                self._send([ticker])
+            else:
+                self._send([], code="51001", msg="Instrument ID does not exist")
+        elif url.path == "/api/v5/market/tickers":
+            self._send(chain.futures_tickers())
+        elif url.path == "/api/v5/market/index-tickers":
+            self._send([{"instId": chain.underlying, "idxPx": str(chain.spot)}])
+        else:
+            self.send_error(404)
+
+
+class StubOkxServer:
+    """在本地线程中运行的OKX接口桩服务器"""
+
+    def __init__(self, chain: Optional[SyntheticChain] = None, host: str = "127.0.0.1", port: int = 0):
+        self.httpd = ThreadingHTTPServer((host, port), _StubHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.chain = chain or SyntheticChain()
+        self.thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def set_chain(self, chain: SyntheticChain):
+        """替换服务器提供的期权链"""
+        self.httpd.chain = chain
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
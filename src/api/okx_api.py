@@ -1,16 +1,24 @@
+import os
 import requests
 from typing import List, Dict
 from datetime import datetime
+from src.utils.perf_monitor import span
 
 class OkxApi:
-    def __init__(self):
-        self.base_url = "https://www.okx.com"
+    def __init__(self, base_url=None):
+        # 可通过环境变量 OKX_BASE_URL 指向本地测试服务器
+        self.base_url = base_url or os.environ.get("OKX_BASE_URL", "https://www.okx.com")
+
+    def _get(self, path, params=None):
+        """发送GET请求，并按接口记录耗时"""
+        with span(f"api:{path}"):
+            return requests.get(f"{self.base_url}{path}", params=params)
         
     def get_instruments(self) -> List[Dict]:
         """获取所有期权合约信息"""
         try:
-            response = requests.get(
-                f"{self.base_url}/api/v5/public/instruments",
+            response = self._get(
+                "/api/v5/public/instruments",
                 params={"instType": "OPTION"}
             )
             response.raise_for_status()
@@ -23,12 +31,12 @@ class OkxApi:
         """获取期权到期日列表"""
         try:
             # 调用获取期权合约信息接口
-            url = f"{self.base_url}/api/v5/public/instruments"
+            path = "/api/v5/public/instruments"
             params = {
                 "instType": "OPTION",
                 "uly": underlying
             }
-            response = requests.get(url, params=params)
+            response = self._get(path, params=params)
             data = response.json()
             
             if data["code"] == "0":
@@ -54,12 +62,12 @@ class OkxApi:
     def get_strike_prices(self, underlying="BTC-USD", expiry=None):
         """获取某个到期日的行权价列表"""
         try:
-            url = f"{self.base_url}/api/v5/public/instruments"
+            path = "/api/v5/public/instruments"
             params = {
                 "instType": "OPTION",
                 "uly": underlying
             }
-            response = requests.get(url, params=params)
+            response = self._get(path, params=params)
             data = response.json()
             
             if data["code"] == "0":
@@ -93,13 +101,13 @@ class OkxApi:
             strike_str = f"{int(float(strike)):05d}"
             inst_id = f"{underlying}-{expiry}-{strike_str}-{option_type}"
             
-            url = f"{self.base_url}/api/v5/market/ticker"
+            path = "/api/v5/market/ticker"
             params = {
                 "instId": inst_id
             }
             print(f"请求期权价格，合约ID: {inst_id}")  # 调试信息
             
-            response = requests.get(url, params=params)
+            response = self._get(path, params=params)
             data = response.json()
             
             if data["code"] == "0" and data["data"]:
@@ -115,4 +123,45 @@ class OkxApi:
                 
         except Exception as e:
             print(f"获取期权价格出错: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    def get_futures_tickers(self, underlying="BTC-USD"):
+        """批量获取交割合约行情（一次请求返回所有到期日）"""
+        try:
+            path = "/api/v5/market/tickers"
+            params = {
+                "instType": "FUTURES",
+                "uly": underlying
+            }
+            response = self._get(path, params=params)
+            data = response.json()
+
+            if data["code"] == "0":
+                return data["data"]
+            else:
+                print(f"获取交割合约行情失败: {data}")
+                return []
+
+        except Exception as e:
+            print(f"获取交割合约行情出错: {e}")
+            return []
+
+    def get_index_price(self, underlying="BTC-USD"):
+        """获取标的指数价格"""
+        try:
+            path = "/api/v5/market/index-tickers"
+            params = {
+                "instId": underlying
+            }
+            response = self._get(path, params=params)
+            data = response.json()
+
+            if data["code"] == "0" and data["data"]:
+                return float(data["data"][0]["idxPx"])
+            else:
+                print(f"获取指数价格失败: {data}")
+                return None
+
+        except Exception as e:
+            print(f"获取指数价格出错: {e}")
+            return None
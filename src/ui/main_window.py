@@ -13,9 +13,11 @@ import matplotlib.pyplot as plt
 from scipy.optimize import fsolve
 
 from src.ui.option_selector import OptionSelector
+from src.ui.perf_panel import PerfPanel
 from src.utils.payoff_calculator import calculate_payoff
 from src.utils.position_manager import PositionManager
 from src.utils.greeks_calculator import calculate_greeks  # 待实现
+from src.utils.perf_monitor import span, incr, timed
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -59,12 +61,18 @@ class MainWindow(QMainWindow):
         load_btn = QPushButton("加载组合")
         load_btn.clicked.connect(self.load_positions)
         
+        # 添加性能面板按钮
+        self.perf_panel = None
+        perf_btn = QPushButton("性能面板")
+        perf_btn.clicked.connect(self.show_perf_panel)
+        
         # 添加希腊字母显示
         self.greeks_table = QTableWidget()
         self.setup_greeks_table()
         
         button_layout.addWidget(save_btn)
         button_layout.addWidget(load_btn)
+        button_layout.addWidget(perf_btn)
         layout.addLayout(button_layout)
         layout.addWidget(self.greeks_table)
         
@@ -83,9 +91,11 @@ class MainWindow(QMainWindow):
         self.update_chart()
         self.update_greeks()
         
+    @timed("ui:update_position_table")
     def update_position_table(self):
         """更新头寸表格"""
         self.position_table.setRowCount(len(self.positions))
+        incr("ui:position_table_cell_widgets", 3 * len(self.positions))
         
         for i, pos in enumerate(self.positions):
             # 设置颜色
@@ -157,6 +167,7 @@ class MainWindow(QMainWindow):
         self.update_chart()
         self.update_greeks()
     
+    @timed("ui:update_chart")
     def update_chart(self):
         """更新盈亏图表"""
         if not self.positions:
@@ -209,27 +220,7 @@ class MainWindow(QMainWindow):
             return calculate_payoff(self.positions, np.array([x]))[0]
         
         try:
-            breakeven_points = []
-            for x0 in strikes:
-                # 在行权价附近寻找盈亏平衡点
-                x_range = np.linspace(x0 * 0.8, x0 * 1.2, 1000)
-                y_values = calculate_payoff(self.positions, x_range)
-                
-                # 找出y值符号改变的位置
-                sign_changes = np.where(np.diff(np.signbit(y_values)))[0]
-                
-                for idx in sign_changes:
-                    # 使用线性插值找到更精确的零点
-                    x1, x2 = x_range[idx], x_range[idx + 1]
-                    y1, y2 = y_values[idx], y_values[idx + 1]
-                    root = x1 - y1 * (x2 - x1) / (y2 - y1)
-                    
-                    # 检查是否是有效的盈亏平衡点
-                    if min(spot_prices) <= root <= max(spot_prices):
-                        breakeven_points.append(root)
-            
-            # 移除重复的盈亏平衡点
-            breakeven_points = sorted(set([round(x, 2) for x in breakeven_points]))
+            breakeven_points = self.find_breakeven_points(strikes, spot_prices)
             
             for point in breakeven_points:
                 ax.plot(point, 0, 'go')  # 绿点标记
@@ -276,7 +267,33 @@ class MainWindow(QMainWindow):
         ax.set_yticks(y_ticks)
         ax.yaxis.set_major_formatter(plt.FormatStrFormatter('%.4f'))
         
-        self.canvas.draw()
+        with span("ui:canvas_draw"):
+            self.canvas.draw()
+    
+    @timed("ui:breakeven_search")
+    def find_breakeven_points(self, strikes, spot_prices):
+        """在各行权价附近寻找盈亏平衡点"""
+        breakeven_points = []
+        for x0 in strikes:
+            # 在行权价附近寻找盈亏平衡点
+            x_range = np.linspace(x0 * 0.8, x0 * 1.2, 1000)
+            y_values = calculate_payoff(self.positions, x_range)
+            
+            # 找出y值符号改变的位置
+            sign_changes = np.where(np.diff(np.signbit(y_values)))[0]
+            
+            for idx in sign_changes:
+                # 使用线性插值找到更精确的零点
+                x1, x2 = x_range[idx], x_range[idx + 1]
+                y1, y2 = y_values[idx], y_values[idx + 1]
+                root = x1 - y1 * (x2 - x1) / (y2 - y1)
+                
+                # 检查是否是有效的盈亏平衡点
+                if min(spot_prices) <= root <= max(spot_prices):
+                    breakeven_points.append(root)
+        
+        # 移除重复的盈亏平衡点
+        return sorted(set([round(x, 2) for x in breakeven_points]))
     
     def delete_selected_positions(self):
         """删除选中的期权头寸"""
@@ -309,6 +326,21 @@ class MainWindow(QMainWindow):
         for i, (name, value) in enumerate(greeks.items()):
             self.greeks_table.setItem(0, i, QTableWidgetItem(f"{value:.4f}"))
             
+    def show_perf_panel(self):
+        """显示性能统计面板"""
+        if self.perf_panel is None:
+            # 作为独立窗口显示，但随主窗口一起关闭
+            self.perf_panel = PerfPanel(self)
+            self.perf_panel.setWindowFlag(Qt.WindowType.Window)
+        self.perf_panel.show()
+        self.perf_panel.raise_()
+            
+    def closeEvent(self, event):
+        """关闭主窗口时一并关闭性能面板"""
+        if self.perf_panel is not None:
+            self.perf_panel.close()
+        super().closeEvent(event)
+            
     def save_positions(self):
         """保存当前期权组合"""
         filename, _ = QFileDialog.getSaveFileName(
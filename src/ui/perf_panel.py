@@ -0,0 +1,101 @@
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
+    QTableWidget, QTableWidgetItem, QCheckBox, QFileDialog
+)
+from PyQt6.QtCore import QTimer
+
+from src.utils.perf_monitor import monitor
+
+class PerfPanel(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("性能统计")
+        self.setMinimumSize(700, 400)
+
+        layout = QVBoxLayout(self)
+
+        # 控制按钮
+        control_layout = QHBoxLayout()
+        self.enable_check = QCheckBox("启用统计")
+        self.enable_check.setChecked(monitor.enabled)
+        self.enable_check.toggled.connect(self.on_enable_toggled)
+        reset_btn = QPushButton("清空")
+        reset_btn.clicked.connect(self.reset_stats)
+        export_btn = QPushButton("导出")
+        export_btn.clicked.connect(self.export_stats)
+        control_layout.addWidget(self.enable_check)
+        control_layout.addWidget(reset_btn)
+        control_layout.addWidget(export_btn)
+        layout.addLayout(control_layout)
+
+        # 耗时统计表格
+        self.timing_table = QTableWidget()
+        self.timing_table.setColumnCount(7)
+        self.timing_table.setHorizontalHeaderLabels([
+            "名称", "次数", "平均(ms)", "P50(ms)", "P95(ms)", "最大(ms)", "出错"
+        ])
+        self.timing_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        layout.addWidget(self.timing_table)
+
+        # 计数器表格
+        self.counter_table = QTableWidget()
+        self.counter_table.setColumnCount(2)
+        self.counter_table.setHorizontalHeaderLabels(["计数器", "数值"])
+        self.counter_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        layout.addWidget(self.counter_table)
+
+        # 定时刷新，只在面板可见时运行
+        self.timer = QTimer(self)
+        self.timer.setInterval(1000)
+        self.timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.refresh()
+        self.timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def on_enable_toggled(self, checked):
+        """开启/关闭统计"""
+        monitor.enabled = checked
+
+    def reset_stats(self):
+        """清空统计数据"""
+        monitor.reset()
+        self.refresh()
+
+    def export_stats(self):
+        """导出统计数据"""
+        filename, _ = QFileDialog.getSaveFileName(
+            self, "导出性能数据", "", "JSON文件 (*.json)"
+        )
+        if filename:
+            monitor.export(filename)
+
+    def refresh(self):
+        """刷新表格"""
+        snapshot = monitor.snapshot(include_events=False)
+
+        timings = sorted(snapshot["timings"].items(), key=lambda kv: -kv[1]["total_ms"])
+        self.timing_table.setRowCount(len(timings))
+        for i, (name, stats) in enumerate(timings):
+            values = [
+                name,
+                str(stats["count"]),
+                f"{stats['avg_ms']:.2f}",
+                f"{stats['p50_ms']:.2f}",
+                f"{stats['p95_ms']:.2f}",
+                f"{stats['max_ms']:.2f}",
+                str(stats["errors"])
+            ]
+            for col, value in enumerate(values):
+                self.timing_table.setItem(i, col, QTableWidgetItem(value))
+
+        counters = sorted(snapshot["counters"].items())
+        self.counter_table.setRowCount(len(counters))
+        for i, (name, value) in enumerate(counters):
+            self.counter_table.setItem(i, 0, QTableWidgetItem(name))
+            self.counter_table.setItem(i, 1, QTableWidgetItem(str(value)))
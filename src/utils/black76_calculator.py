@@ -0,0 +1,115 @@
+import numpy as np
+from typing import List, Dict, Optional
+from scipy.stats import norm
+
+from src.utils.greeks_calculator import calculate_time_to_expiry
+from src.utils.forward_curve import ForwardCurve, get_forward_curve
+from src.utils.perf_monitor import timed
+
+GREEK_NAMES = ["Delta", "Gamma", "Theta", "Vega", "Rho"]
+
+
+def black76_inverse(forward, strike, expiry, volatility, is_call, risk_free_rate=0.0) -> Dict[str, np.ndarray]:
+    """币本位（反向）期权的Black-76定价，参数均可为数组
+
+    USD价格为远期上的Black-76价格；币本位权利金按OKX惯例以远期价格折算：
+    premium_coin = premium_usd / forward
+    """
+    forward = np.asarray(forward, dtype=float)
+    strike = np.asarray(strike, dtype=float)
+    expiry = np.asarray(expiry, dtype=float)
+    volatility = np.asarray(volatility, dtype=float)
+    is_call = np.asarray(is_call, dtype=bool)
+
+    discount = np.exp(-risk_free_rate * expiry)
+    sqrt_t = np.sqrt(expiry)
+    d1 = (np.log(forward / strike) + volatility**2 / 2 * expiry) / (volatility * sqrt_t)
+    d2 = d1 - volatility * sqrt_t
+    pdf_d1 = norm.pdf(d1)
+
+    call_price = discount * (forward * norm.cdf(d1) - strike * norm.cdf(d2))
+    put_price = discount * (strike * norm.cdf(-d2) - forward * norm.cdf(-d1))
+    price_usd = np.where(is_call, call_price, put_price)
+    price_coin = price_usd / forward
+
+    # USD计价的希腊字母（对远期价格求导）
+    delta_usd = discount * np.where(is_call, norm.cdf(d1), norm.cdf(d1) - 1)
+    gamma_usd = discount * pdf_d1 / (forward * volatility * sqrt_t)
+    vega_usd = discount * forward * sqrt_t * pdf_d1 / 100  # 1%波动率变化
+    theta_usd = (-discount * forward * pdf_d1 * volatility / (2 * sqrt_t)
+                 + risk_free_rate * price_usd) / 365  # 每天
+    rho_usd = -expiry * price_usd / 100  # 1%利率变化
+
+    # 币本位希腊字母：Delta为等值BTC敞口，需扣除以币计价的权利金
+    delta_coin = delta_usd - price_coin
+    gamma_coin = gamma_usd - delta_coin / forward
+
+    return {
+        "price_usd": price_usd,
+        "price_coin": price_coin,
+        "usd": {
+            "Delta": delta_usd,
+            "Gamma": gamma_usd,
+            "Theta": theta_usd,
+            "Vega": vega_usd,
+            "Rho": rho_usd
+        },
+        "coin": {
+            "Delta": delta_coin,
+            "Gamma": gamma_coin,
+            "Theta": theta_usd / forward,
+            "Vega": vega_usd / forward,
+            "Rho": rho_usd / forward
+        }
+    }
+
+
+def price_positions(positions: List[Dict], forward_curve: Optional[ForwardCurve] = None,
+                    volatility: float = 0.65, risk_free_rate: float = 0.0) -> Dict[str, np.ndarray]:
+    """按每个头寸的标的和到期日从远期曲线取价，批量计算理论价格和希腊字母
+
+    未指定 forward_curve 时每个标的使用各自的共享曲线；指定时所有头寸必须属于该曲线的标的
+    """
+    underlyings = [pos["underlying"] for pos in positions]
+    if forward_curve is not None:
+        others = set(underlyings) - {forward_curve.underlying}
+        if others:
+            raise ValueError(f"头寸标的 {sorted(others)} 与远期曲线标的 {forward_curve.underlying} 不一致")
+
+    # 按标的分组，每组从对应曲线一次性取远期价格
+    forwards = np.empty(len(positions))
+    for underlying in set(underlyings):
+        curve = forward_curve or get_forward_curve(underlying)
+        indices = [i for i, u in enumerate(underlyings) if u == underlying]
+        forwards[indices] = curve.get_forwards([positions[i]["expiry"] for i in indices])
+
+    strikes = np.array([float(pos["strike"]) for pos in positions])
+    expiries = np.array([calculate_time_to_expiry(pos["expiry"]) for pos in positions])
+    is_call = np.array([pos["type"] == "C" for pos in positions])
+
+    return black76_inverse(forwards, strikes, expiries, volatility, is_call, risk_free_rate)
+
+
+@timed("pricing:calculate_inverse_greeks")
+def calculate_inverse_greeks(positions: List[Dict], forward_curve: Optional[ForwardCurve] = None,
+                             volatility: float = 0.65, risk_free_rate: float = 0.0,
+                             unit: str = "coin") -> Dict[str, float]:
+    """计算币本位期权组合的希腊字母（Black-76模式）
+
+    unit 为 "coin" 时以BTC计价，为 "usd" 时以美元计价；
+    缺少远期价格时对应结果为NaN，以区别于零敞口
+    """
+    total_greeks = {name: 0.0 for name in GREEK_NAMES}
+    if not positions:
+        return total_greeks
+
+    result = price_positions(positions, forward_curve, volatility, risk_free_rate)
+
+    signs = np.array([1 if pos["side"] == "buy" else -1 for pos in positions])
+    quantities = np.array([float(pos["quantity"]) for pos in positions])
+    weights = signs * quantities
+
+    for name in GREEK_NAMES:
+        total_greeks[name] = float(np.sum(weights * result[unit][name]))
+
+    return total_greeks
@@ -0,0 +1,124 @@
+import time
+import numpy as np
+from typing import Dict, List, Optional
+
+from src.api.okx_api import OkxApi
+from src.utils.greeks_calculator import calculate_time_to_expiry
+from src.utils.perf_monitor import timed
+
+
+class ForwardCurve:
+    """由交割合约行情构建的远期价格曲线（币本位）"""
+
+    def __init__(self, api: Optional[OkxApi] = None, underlying: str = "BTC-USD",
+                 ttl: float = 30.0, clock=time.monotonic):
+        self.api = api or OkxApi()
+        self.underlying = underlying
+        self.ttl = ttl  # 缓存有效期（秒）
+        self.clock = clock
+
+        # 曲线节点：到期时间（年化）及对应的对数远期价格
+        self._times = np.array([], dtype=float)
+        self._log_forwards = np.array([], dtype=float)
+        self._spot = None
+        self._fetched_at = None
+
+        # 按到期日缓存的远期价格，随整条曲线一起在刷新时失效
+        self._cache: Dict[str, float] = {}
+
+    @staticmethod
+    def _ticker_price(ticker: Dict) -> float:
+        """取交割合约的中间价，缺失时退回最新成交价"""
+        bid = float(ticker["bidPx"]) if ticker.get("bidPx") else 0
+        ask = float(ticker["askPx"]) if ticker.get("askPx") else 0
+        if bid > 0 and ask > 0:
+            return (bid + ask) / 2
+        return float(ticker["last"]) if ticker.get("last") else 0
+
+    def is_stale(self) -> bool:
+        """判断曲线是否需要重新拉取"""
+        return self._fetched_at is None or self.clock() - self._fetched_at > self.ttl
+
+    @timed("pricing:forward_curve_refresh")
+    def refresh(self):
+        """批量拉取交割合约行情并重建曲线节点"""
+        # 无论成功与否都记录拉取时间，失败时继续使用上一条曲线，直到缓存过期再重试
+        self._fetched_at = self.clock()
+        tickers = self.api.get_futures_tickers(self.underlying)
+
+        nodes = {}
+        for ticker in tickers:
+            # 合约名称格式: BTC-USD-240628
+            expiry = ticker["instId"].split("-")[-1]
+            price = self._ticker_price(ticker)
+            if price > 0:
+                nodes[calculate_time_to_expiry(expiry)] = price
+
+        if not nodes:
+            # 没有交割合约行情时保留上一条曲线，仅有指数价格不足以构建远期曲线
+            print("无法构建远期曲线：没有可用的交割合约行情")
+            return
+
+        spot = self.api.get_index_price(self.underlying)
+        if spot:
+            # 以指数价格作为 t=0 处的锚点
+            nodes[0.0] = spot
+            self._spot = spot
+
+        times = np.array(sorted(nodes))
+        self._times = times
+        self._log_forwards = np.log([nodes[t] for t in times])
+        self._cache.clear()
+
+    def _interpolate(self, times: np.ndarray) -> np.ndarray:
+        """在对数远期价格上按时间线性插值（节点间隐含持有成本恒定）"""
+        if len(self._times) == 1:
+            return np.full_like(times, np.exp(self._log_forwards[0]), dtype=float)
+
+        log_forwards = np.interp(times, self._times, self._log_forwards)
+
+        # 超出最远节点时，沿用最后一段的隐含持有成本外推
+        t0, t1 = self._times[-2], self._times[-1]
+        slope = (self._log_forwards[-1] - self._log_forwards[-2]) / (t1 - t0)
+        beyond = times > t1
+        log_forwards[beyond] = self._log_forwards[-1] + slope * (times[beyond] - t1)
+
+        return np.exp(log_forwards)
+
+    def get_forwards(self, expiries: List[str]) -> np.ndarray:
+        """获取一组到期日（YYMMDD）对应的远期价格，曲线从未成功加载时返回NaN"""
+        if self.is_stale():
+            self.refresh()
+        if len(self._times) == 0:
+            return np.full(len(expiries), np.nan)
+
+        # 只对未缓存的到期日做一次向量化插值
+        missing = sorted(set(e for e in expiries if e not in self._cache))
+        if missing:
+            times = np.array([calculate_time_to_expiry(e) for e in missing])
+            for expiry, forward in zip(missing, self._interpolate(times)):
+                self._cache[expiry] = float(forward)
+
+        return np.array([self._cache[e] for e in expiries])
+
+    def get_forward(self, expiry: str) -> float:
+        """获取单个到期日的远期价格"""
+        return float(self.get_forwards([expiry])[0])
+
+    @property
+    def spot(self) -> Optional[float]:
+        """最近一次拉取到的指数价格"""
+        if self.is_stale():
+            self.refresh()
+        return self._spot
+
+
+# 按标的共享的远期曲线，使缓存在多次调用之间生效
+_curves: Dict[str, ForwardCurve] = {}
+
+
+def get_forward_curve(underlying: str = "BTC-USD") -> ForwardCurve:
+    """获取某个标的的共享远期曲线"""
+    if underlying not in _curves:
+        _curves[underlying] = ForwardCurve(underlying=underlying)
+    return _curves[underlying]
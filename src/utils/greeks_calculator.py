@@ -2,6 +2,7 @@ import numpy as np
 from typing import List, Dict
 from scipy.stats import norm
 from datetime import datetime
+from src.utils.perf_monitor import timed
 
 def calculate_time_to_expiry(expiry_str: str) -> float:
     """计算到期时间（年化）"""
@@ -10,6 +11,7 @@ def calculate_time_to_expiry(expiry_str: str) -> float:
     days_to_expiry = (expiry_date - now).days + (expiry_date - now).seconds / 86400
     return max(days_to_expiry / 365, 0.00001)  # 避免除以0
 
+@timed("pricing:calculate_greeks")
 def calculate_greeks(positions: List[Dict]) -> Dict[str, float]:
     """计算期权组合的希腊字母（BS模式）"""
     total_greeks = {
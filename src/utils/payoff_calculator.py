@@ -1,6 +1,8 @@
 import numpy as np
 from typing import List, Dict
+from src.utils.perf_monitor import timed
 
+@timed("pricing:calculate_payoff")
 def calculate_payoff(positions: List[Dict], spot_prices: np.ndarray) -> np.ndarray:
     """计算期权组合在不同价格点的盈亏"""
     total_payoff = np.zeros_like(spot_prices, dtype=float)
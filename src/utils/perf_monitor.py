@@ -0,0 +1,183 @@
+import os
+import json
+import time
+import threading
+from collections import deque
+from functools import wraps
+from typing import Dict
+
+# 延迟直方图的桶上界（毫秒），最后一个桶收集所有更慢的事件
+LATENCY_BUCKETS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, float("inf")]
+
+
+class _NullSpan:
+    """未启用时使用的空计时区间，不做任何记录"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """计时区间，退出时把耗时记入监控器"""
+
+    def __init__(self, monitor, name: str):
+        self.monitor = monitor
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.monitor.record(self.name, time.perf_counter() - self.start, error=exc_type is not None)
+        return False
+
+
+class PerfMonitor:
+    """热点路径的耗时与计数统计"""
+
+    def __init__(self, enabled: bool = False, buffer_size: int = 1000):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._events = deque(maxlen=buffer_size)  # 最近事件的环形缓冲区
+        self._timings: Dict[str, Dict] = {}
+        self._counters: Dict[str, int] = {}
+
+    def span(self, name: str):
+        """返回一个计时区间，用于 with 语句"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def record(self, name: str, seconds: float, error: bool = False):
+        """记录一次耗时"""
+        if not self.enabled:
+            return
+        ms = seconds * 1000
+        with self._lock:
+            stats = self._timings.get(name)
+            if stats is None:
+                stats = {
+                    "count": 0,
+                    "errors": 0,
+                    "total_ms": 0.0,
+                    "min_ms": float("inf"),
+                    "max_ms": 0.0,
+                    "buckets": [0] * len(LATENCY_BUCKETS_MS)
+                }
+                self._timings[name] = stats
+            stats["count"] += 1
+            stats["errors"] += int(error)
+            stats["total_ms"] += ms
+            stats["min_ms"] = min(stats["min_ms"], ms)
+            stats["max_ms"] = max(stats["max_ms"], ms)
+            for i, bound in enumerate(LATENCY_BUCKETS_MS):
+                if ms <= bound:
+                    stats["buckets"][i] += 1
+                    break
+            self._events.append({
+                "time": time.time(),
+                "kind": "span",
+                "name": name,
+                "ms": ms,
+                "error": error
+            })
+
+    def incr(self, name: str, value: int = 1):
+        """计数器累加"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+            self._events.append({
+                "time": time.time(),
+                "kind": "counter",
+                "name": name,
+                "value": value
+            })
+
+    @staticmethod
+    def _percentile(stats: Dict, q: float) -> float:
+        """按直方图估算分位数（返回所在桶的上界）"""
+        target = stats["count"] * q
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, stats["buckets"]):
+            seen += count
+            if seen >= target:
+                return min(bound, stats["max_ms"])
+        return stats["max_ms"]
+
+    def snapshot(self, include_events: bool = True) -> Dict:
+        """获取当前统计数据的副本，不需要事件明细时可跳过环形缓冲区的复制"""
+        with self._lock:
+            timings = {}
+            for name, stats in self._timings.items():
+                timings[name] = dict(
+                    stats,
+                    buckets=list(stats["buckets"]),
+                    avg_ms=stats["total_ms"] / stats["count"],
+                    p50_ms=self._percentile(stats, 0.5),
+                    p95_ms=self._percentile(stats, 0.95)
+                )
+            snapshot = {
+                "enabled": self.enabled,
+                "bucket_bounds_ms": [str(b) if b == float("inf") else b for b in LATENCY_BUCKETS_MS],
+                "timings": timings,
+                "counters": dict(self._counters)
+            }
+            if include_events:
+                snapshot["events"] = list(self._events)
+            return snapshot
+
+    def reset(self):
+        """清空所有统计数据"""
+        with self._lock:
+            self._events.clear()
+            self._timings.clear()
+            self._counters.clear()
+
+    def export(self, filename: str):
+        """导出统计数据到JSON文件"""
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, indent=4, ensure_ascii=False)
+
+
+# 全局监控器，设置环境变量 OPTIONTOOL_PERF=1 时默认启用
+monitor = PerfMonitor(enabled=os.environ.get("OPTIONTOOL_PERF") == "1")
+
+
+def span(name: str):
+    """全局监控器的计时区间"""
+    return monitor.span(name)
+
+
+def incr(name: str, value: int = 1):
+    """全局监控器的计数器"""
+    monitor.incr(name, value)
+
+
+def timed(name: str):
+    """函数耗时统计装饰器，未启用时直接调用原函数"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not monitor.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            error = True
+            try:
+                result = func(*args, **kwargs)
+                error = False
+                return result
+            finally:
+                monitor.record(name, time.perf_counter() - start, error=error)
+        return wrapper
+    return decorator
+
@@ -1,15 +1,18 @@
 import json
 from typing import List, Dict
 from src.api.okx_api import OkxApi
+from src.utils.perf_monitor import timed
 
 class PositionManager:
     @staticmethod
+    @timed("positions:save")
     def save_positions(positions: List[Dict], filename: str):
         """保存期权组合到文件"""
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(positions, f, indent=4, ensure_ascii=False)
             
     @staticmethod
+    @timed("positions:load")
     def load_positions(filename: str) -> List[Dict]:
         """从文件加载期权组合并更新价格"""
         with open(filename, 'r', encoding='utf-8') as f: